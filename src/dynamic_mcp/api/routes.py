@@ -12,9 +12,19 @@ The docstrings on each endpoint become the tool descriptions that
 MCP clients see, so they should be clear and informative.
 """
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
-from typing import Literal
+import itertools
+import math
+import operator
+from array import array
+from collections.abc import Iterable, Iterator, MutableMapping
+from enum import IntEnum
+from typing import Annotated
+
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, PlainSerializer, PlainValidator, WithJsonSchema
+from pydantic_core import PydanticCustomError
 
 
 # =============================================================================
@@ -36,10 +46,58 @@ class ItemResponse(BaseModel):
     price: float = Field(..., description="Price of the item")
 
 
+class ItemStats(BaseModel):
+    """Model for aggregate price statistics over all items."""
+    count: int = Field(..., description="Number of items")
+    total: float = Field(..., description="Sum of all item prices")
+    mean: float | None = Field(None, description="Average item price (null if there are no items)")
+    min: float | None = Field(None, description="Lowest item price (null if there are no items)")
+    max: float | None = Field(None, description="Highest item price (null if there are no items)")
+
+
+class Operation(IntEnum):
+    """Arithmetic operations. Names are lowercase on the wire, ints internally."""
+    ADD = 0
+    SUBTRACT = 1
+    MULTIPLY = 2
+    DIVIDE = 3
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+
+_OPERATION_BY_NAME = {str(op): op for op in Operation}
+_EXPECTED_OPERATIONS = "'add', 'subtract', 'multiply' or 'divide'"
+
+
+def _parse_operation(value: object) -> Operation:
+    """Map an operation name (or an Operation) to its Operation code."""
+    if isinstance(value, Operation):
+        return value
+    op = _OPERATION_BY_NAME.get(value) if isinstance(value, str) else None
+    if op is None:
+        # Same error as a Literal of the names, so 422 bodies stay unchanged
+        raise PydanticCustomError(
+            "literal_error", "Input should be {expected}", {"expected": _EXPECTED_OPERATIONS}
+        )
+    return op
+
+
+# Parsed once into an Operation code; serialized and documented as the name
+# string. Declared on int (Operation's base) so the enum itself is not emitted
+# into the OpenAPI components.
+OperationName = Annotated[
+    int,
+    PlainValidator(_parse_operation),
+    PlainSerializer(str, return_type=str),
+    WithJsonSchema({"type": "string", "enum": list(_OPERATION_BY_NAME)}),
+]
+
+
 class CalculationRequest(BaseModel):
     """Model for calculation requests."""
-    operation: Literal["add", "subtract", "multiply", "divide"] = Field(
-        ..., description="The arithmetic operation to perform"
+    operation: OperationName = Field(
+        ..., title="Operation", description="The arithmetic operation to perform"
     )
     a: float = Field(..., description="First operand")
     b: float = Field(..., description="Second operand")
@@ -57,13 +115,160 @@ class CalculationResponse(BaseModel):
 # In-Memory Database
 # =============================================================================
 
+class ItemStore(MutableMapping[int, ItemResponse]):
+    """
+    Columnar (struct-of-arrays) in-memory item storage.
+    
+    Each field lives in its own column indexed by row number, with an
+    id -> row map for lookups. The read path (row() / rows()) builds plain
+    dicts straight from the columns, so no Pydantic objects are created.
+    The dict-like interface, which accepts and returns ItemResponse, is kept
+    for writes and for code that treats the store as a mapping.
+    
+    Deleting swaps the last row into the freed slot, so iteration order is
+    insertion order only until the first delete.
+    """
+
+    def __init__(self, items: Iterable[ItemResponse] = ()) -> None:
+        self._ids: list[int] = []
+        self._names: list[str] = []
+        self._descs: list[str | None] = []
+        self._prices = array("d")
+        self._row_of: dict[int, int] = {}
+        for item in items:
+            self[item.id] = item
+
+    def row(self, item_id: int) -> dict:
+        """Get an item as a plain dict. Raises KeyError for unknown IDs."""
+        row = self._row_of[item_id]
+        return {
+            "id": self._ids[row],
+            "name": self._names[row],
+            "description": self._descs[row],
+            "price": self._prices[row],
+        }
+
+    def rows(self) -> list[dict]:
+        """Get all items as plain dicts, in row order."""
+        return [
+            {"id": item_id, "name": name, "description": desc, "price": price}
+            for item_id, name, desc, price in zip(
+                self._ids, self._names, self._descs, self._prices
+            )
+        ]
+
+    def price_stats(self) -> dict:
+        """
+        Aggregate the price column.
+        
+        Prices are a contiguous array of doubles, so each reduction is a
+        single C-level pass with no per-item attribute lookups.
+        """
+        prices = self._prices
+        if not prices:
+            return {"count": 0, "total": 0.0, "mean": None, "min": None, "max": None}
+        total = math.fsum(prices)
+        return {
+            "count": len(prices),
+            "total": total,
+            "mean": total / len(prices),
+            "min": min(prices),
+            "max": max(prices),
+        }
+
+    def copy(self) -> "ItemStore":
+        """Copy the store column by column, without building any items."""
+        store = ItemStore()
+        store._ids = self._ids.copy()
+        store._names = self._names.copy()
+        store._descs = self._descs.copy()
+        store._prices = array("d", self._prices)
+        store._row_of = self._row_of.copy()
+        return store
+
+    def values(self) -> list[ItemResponse]:
+        """Get all items, built in one pass over the columns."""
+        return [ItemResponse.model_construct(**row) for row in self.rows()]
+
+    def items(self) -> list[tuple[int, ItemResponse]]:
+        """Get all (id, item) pairs, built in one pass over the columns."""
+        return [(row["id"], ItemResponse.model_construct(**row)) for row in self.rows()]
+
+    def __getitem__(self, item_id: int) -> ItemResponse:
+        return ItemResponse.model_construct(**self.row(item_id))
+
+    def __setitem__(self, item_id: int, item: ItemResponse) -> None:
+        row = self._row_of.get(item_id)
+        if row is None:
+            self._row_of[item_id] = len(self._ids)
+            self._ids.append(item_id)
+            self._names.append(item.name)
+            self._descs.append(item.description)
+            self._prices.append(item.price)
+        else:
+            self._names[row] = item.name
+            self._descs[row] = item.description
+            self._prices[row] = item.price
+
+    def __delitem__(self, item_id: int) -> None:
+        row = self._row_of.pop(item_id)
+        last = len(self._ids) - 1
+        if row != last:
+            # Move the last row into the freed slot
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._names[row] = self._names[last]
+            self._descs[row] = self._descs[last]
+            self._prices[row] = self._prices[last]
+            self._row_of[moved_id] = row
+        self._ids.pop()
+        self._names.pop()
+        self._descs.pop()
+        self._prices.pop()
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._row_of
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._names.clear()
+        self._descs.clear()
+        del self._prices[:]
+        self._row_of.clear()
+
+
 # Simple in-memory storage for items
-_items_db: dict[int, ItemResponse] = {
-    1: ItemResponse(id=1, name="Laptop", description="A powerful laptop", price=999.99),
-    2: ItemResponse(id=2, name="Mouse", description="Wireless mouse", price=29.99),
-    3: ItemResponse(id=3, name="Keyboard", description="Mechanical keyboard", price=149.99),
-}
-_next_id = 4
+_items_db = ItemStore([
+    ItemResponse(id=1, name="Laptop", description="A powerful laptop", price=999.99),
+    ItemResponse(id=2, name="Mouse", description="Wireless mouse", price=29.99),
+    ItemResponse(id=3, name="Keyboard", description="Mechanical keyboard", price=149.99),
+])
+
+# Item ID generator. count() increments in C, so concurrent creates never
+# share an ID, without a lock or a module-level "global" rebind.
+_next_id = itertools.count(max(_items_db, default=0) + 1).__next__
+
+# Serialized response payloads. The full list is rebuilt on every write (the
+# rare path) so list_items only has to return it; single-item payloads are
+# built on first read. Writes must call _refresh_cache().
+_items_json: bytes = b""
+_item_cache: dict[int, bytes] = {}
+
+
+def _refresh_cache() -> None:
+    """Rebuild the cached item payloads. Call after every write to _items_db."""
+    global _items_json
+    _items_json = orjson.dumps(_items_db.rows())
+    _item_cache.clear()
+
+
+_refresh_cache()
 
 
 # =============================================================================
@@ -74,12 +279,17 @@ app = FastAPI(
     title="Dynamic MCP Tools API",
     description="REST API that will be exposed as MCP tools dynamically",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 
 # =============================================================================
 # Item CRUD Endpoints
 # These will become MCP tools via FastMCP.from_fastapi()
+#
+# response_model is kept for the OpenAPI schema (and so the MCP tool output
+# schema), but handlers return an ORJSONResponse directly. FastAPI then skips
+# response validation and jsonable_encoder and sends the orjson bytes as-is.
 # =============================================================================
 
 @app.get(
@@ -88,14 +298,32 @@ app = FastAPI(
     operation_id="list_items",
     summary="List all items",
 )
-def list_items() -> list[ItemResponse]:
+async def list_items() -> Response:
     """
     List all items in the inventory.
     
     Returns a list of all items currently stored in the system.
     This is useful for getting an overview of available items.
     """
-    return list(_items_db.values())
+    return Response(_items_json, media_type="application/json")
+
+
+# Declared before /items/{item_id} so "stats" is not matched as an item ID
+@app.get(
+    "/items/stats",
+    response_model=ItemStats,
+    operation_id="item_stats",
+    summary="Get item price statistics",
+)
+async def item_stats() -> ORJSONResponse:
+    """
+    Get aggregate price statistics for the inventory.
+    
+    Returns the number of items and the total, average, lowest and
+    highest price. The average, lowest and highest are null when the
+    inventory is empty.
+    """
+    return ORJSONResponse(_items_db.price_stats())
 
 
 @app.get(
@@ -104,7 +332,7 @@ def list_items() -> list[ItemResponse]:
     operation_id="get_item",
     summary="Get item by ID",
 )
-def get_item(item_id: int) -> ItemResponse:
+async def get_item(item_id: int) -> Response:
     """
     Get a specific item by its ID.
     
@@ -117,9 +345,12 @@ def get_item(item_id: int) -> ItemResponse:
     Raises:
         404: If no item with the given ID exists.
     """
-    if item_id not in _items_db:
-        raise HTTPException(status_code=404, detail=f"Item with ID {item_id} not found")
-    return _items_db[item_id]
+    payload = _item_cache.get(item_id)
+    if payload is None:
+        if item_id not in _items_db:
+            raise HTTPException(status_code=404, detail=f"Item with ID {item_id} not found")
+        payload = _item_cache[item_id] = orjson.dumps(_items_db.row(item_id))
+    return Response(payload, media_type="application/json")
 
 
 @app.post(
@@ -128,7 +359,7 @@ def get_item(item_id: int) -> ItemResponse:
     operation_id="create_item",
     summary="Create a new item",
 )
-def create_item(item: Item) -> ItemResponse:
+async def create_item(item: Item) -> ORJSONResponse:
     """
     Create a new item in the inventory.
     
@@ -138,11 +369,13 @@ def create_item(item: Item) -> ItemResponse:
     Returns:
         The created item with its assigned ID.
     """
-    global _next_id
-    new_item = ItemResponse(id=_next_id, **item.model_dump())
-    _items_db[_next_id] = new_item
-    _next_id += 1
-    return new_item
+    # item is already validated, so build the response without re-validating
+    new_item = ItemResponse.model_construct(
+        id=_next_id(), name=item.name, description=item.description, price=item.price
+    )
+    _items_db[new_item.id] = new_item
+    _refresh_cache()
+    return ORJSONResponse(new_item.model_dump())
 
 
 @app.put(
@@ -151,7 +384,7 @@ def create_item(item: Item) -> ItemResponse:
     operation_id="update_item",
     summary="Update an existing item",
 )
-def update_item(item_id: int, item: Item) -> ItemResponse:
+async def update_item(item_id: int, item: Item) -> ORJSONResponse:
     """
     Update an existing item by its ID.
     
@@ -167,17 +400,21 @@ def update_item(item_id: int, item: Item) -> ItemResponse:
     """
     if item_id not in _items_db:
         raise HTTPException(status_code=404, detail=f"Item with ID {item_id} not found")
-    updated_item = ItemResponse(id=item_id, **item.model_dump())
+    updated_item = ItemResponse.model_construct(
+        id=item_id, name=item.name, description=item.description, price=item.price
+    )
     _items_db[item_id] = updated_item
-    return updated_item
+    _refresh_cache()
+    return ORJSONResponse(updated_item.model_dump())
 
 
 @app.delete(
     "/items/{item_id}",
+    response_model=dict,
     operation_id="delete_item",
     summary="Delete an item",
 )
-def delete_item(item_id: int) -> dict:
+async def delete_item(item_id: int) -> ORJSONResponse:
     """
     Delete an item from the inventory.
     
@@ -193,7 +430,8 @@ def delete_item(item_id: int) -> dict:
     if item_id not in _items_db:
         raise HTTPException(status_code=404, detail=f"Item with ID {item_id} not found")
     del _items_db[item_id]
-    return {"message": f"Item {item_id} deleted successfully"}
+    _refresh_cache()
+    return ORJSONResponse({"message": f"Item {item_id} deleted successfully"})
 
 
 # =============================================================================
@@ -201,13 +439,22 @@ def delete_item(item_id: int) -> dict:
 # Demonstrates a computation tool
 # =============================================================================
 
+# C-implemented arithmetic functions, indexed by Operation code
+_OPERATIONS = (
+    operator.add,
+    operator.sub,
+    operator.mul,
+    operator.truediv,
+)
+
+
 @app.post(
     "/calculate",
     response_model=CalculationResponse,
     operation_id="calculate",
     summary="Perform arithmetic calculation",
 )
-def calculate(request: CalculationRequest) -> CalculationResponse:
+async def calculate(request: CalculationRequest) -> ORJSONResponse:
     """
     Perform an arithmetic calculation.
     
@@ -224,37 +471,33 @@ def calculate(request: CalculationRequest) -> CalculationResponse:
     """
     a, b = request.a, request.b
     
-    if request.operation == "add":
-        result = a + b
-    elif request.operation == "subtract":
-        result = a - b
-    elif request.operation == "multiply":
-        result = a * b
-    elif request.operation == "divide":
-        if b == 0:
-            raise HTTPException(status_code=400, detail="Cannot divide by zero")
-        result = a / b
-    else:
-        raise HTTPException(status_code=400, detail=f"Unknown operation: {request.operation}")
+    if b == 0 and request.operation == Operation.DIVIDE:
+        raise HTTPException(status_code=400, detail="Cannot divide by zero")
+    result = _OPERATIONS[request.operation](a, b)
     
-    return CalculationResponse(
-        operation=request.operation,
-        a=a,
-        b=b,
-        result=result,
-    )
+    return ORJSONResponse({
+        "operation": str(request.operation),
+        "a": a,
+        "b": b,
+        "result": result,
+    })
 
 
 # =============================================================================
 # Health Check Endpoint
 # =============================================================================
 
-@app.get("/health", operation_id="health_check", summary="Health check")
-def health_check() -> dict:
+@app.get(
+    "/health",
+    response_model=dict,
+    operation_id="health_check",
+    summary="Health check",
+)
+async def health_check() -> ORJSONResponse:
     """
     Check if the API is running.
     
     Returns:
         A status message indicating the API is healthy.
     """
-    return {"status": "healthy", "service": "dynamic-mcp-tools"}
+    return ORJSONResponse({"status": "healthy", "service": "dynamic-mcp-tools"})
@@ -15,15 +15,19 @@ The server can be run in different modes:
 - STDIO mode: For direct MCP client connections (e.g., Claude Desktop)
 """
 
-import argparse
+import hashlib
 import sys
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
+import httpx
+import orjson
+from fastapi import APIRouter, FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from fastmcp import FastMCP
 from fastmcp.tools import Tool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from dynamic_mcp.api.routes import app as api_app
 from dynamic_mcp.tools.dynamic import register_dynamic_tools
@@ -44,6 +48,39 @@ def get_mcp_server() -> FastMCP:
     return _mcp_server
 
 
+# =============================================================================
+# Shared HTTP Client (for external API tools)
+# =============================================================================
+
+# A single client is shared by every external API tool so that its connection
+# pool (TCP, TLS and HTTP/2 sessions) is reused across tool invocations
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=200,
+                keepalive_expiry=30.0,
+            ),
+            http2=True,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release its pooled connections."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 # =============================================================================
 # Create MCP Server from FastAPI App
 # =============================================================================
@@ -90,10 +127,55 @@ class ExternalToolConfig(BaseModel):
     http_method: str = Field(default="GET", description="HTTP method (GET, POST, etc.)")
     tags: list[str] = Field(default=[], description="Optional tags for organization")
 
+    @field_validator("tags")
+    @classmethod
+    def _intern_tags(cls, tags: list[str]) -> list[str]:
+        # Tools share a handful of tags, so keep one copy of each string
+        return [sys.intern(tag) for tag in tags]
+
 
 # In-memory registry of dynamically registered external tools
 _external_tools: dict[str, ExternalToolConfig] = {}
 
+# Serialized /tools/ listing and its ETag, reused until the tool set changes.
+# Keyed by (server, _tool_gen, tool names): the REST endpoints bump _tool_gen,
+# and the names catch tools added or removed directly on the MCP server.
+_tool_gen = 0
+_tool_listing_cache: tuple[FastMCP, int, tuple[str, ...], bytes, str] | None = None
+
+
+def _bump_tool_gen() -> None:
+    """Mark the cached tool listing stale. Call after every tool change."""
+    global _tool_gen
+    _tool_gen += 1
+
+
+def _make_query_caller(method: str, url: str) -> Callable[..., Awaitable[dict]]:
+    """Build a tool function that sends its params in the query string."""
+    async def call_external_api(params: dict[str, Any] | None = None) -> dict:
+        response = await get_http_client().request(method, url, params=params)
+        response.raise_for_status()
+        return response.json()
+    return call_external_api
+
+
+def _make_body_caller(method: str, url: str) -> Callable[..., Awaitable[dict]]:
+    """Build a tool function that sends its params as a JSON body."""
+    async def call_external_api(params: dict[str, Any] | None = None) -> dict:
+        response = await get_http_client().request(method, url, json=params)
+        response.raise_for_status()
+        return response.json()
+    return call_external_api
+
+
+# Supported HTTP methods and the factory for their specialized tool function
+_HTTP_METHOD_CALLERS: dict[str, Callable[[str, str], Callable[..., Awaitable[dict]]]] = {
+    "GET": _make_query_caller,
+    "POST": _make_body_caller,
+    "PUT": _make_body_caller,
+    "DELETE": _make_query_caller,
+}
+
 
 def create_external_api_tool(config: ExternalToolConfig) -> Tool:
     """
@@ -107,33 +189,17 @@ def create_external_api_tool(config: ExternalToolConfig) -> Tool:
         
     Returns:
         Tool: A FastMCP Tool that can be registered with the server.
-    """
-    import httpx
-    
-    async def call_external_api(params: dict[str, Any] | None = None) -> dict:
-        """
-        Call the external REST API endpoint.
         
-        Args:
-            params: Optional parameters to pass to the API.
-            
-        Returns:
-            The JSON response from the external API.
-        """
-        async with httpx.AsyncClient() as client:
-            if config.http_method.upper() == "GET":
-                response = await client.get(config.endpoint_url, params=params)
-            elif config.http_method.upper() == "POST":
-                response = await client.post(config.endpoint_url, json=params)
-            elif config.http_method.upper() == "PUT":
-                response = await client.put(config.endpoint_url, json=params)
-            elif config.http_method.upper() == "DELETE":
-                response = await client.delete(config.endpoint_url, params=params)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {config.http_method}")
-            
-            response.raise_for_status()
-            return response.json()
+    Raises:
+        ValueError: If the configured HTTP method is not supported.
+    """
+    # Resolve the HTTP method once at registration time: each method gets a
+    # function with its request argument baked in, so calls never branch on it
+    method = config.http_method.upper()
+    make_caller = _HTTP_METHOD_CALLERS.get(method)
+    if make_caller is None:
+        raise ValueError(f"Unsupported HTTP method: {config.http_method}")
+    call_external_api = make_caller(method, config.endpoint_url)
     
     # Update function metadata for better tool descriptions
     call_external_api.__doc__ = f"{config.description}\n\nCalls: {config.http_method} {config.endpoint_url}"
@@ -147,44 +213,99 @@ def create_external_api_tool(config: ExternalToolConfig) -> Tool:
     )
 
 
-# FastAPI router for runtime tool management
-from fastapi import APIRouter
-tools_router = APIRouter(prefix="/tools", tags=["Tool Management"])
+def _tool_summary(config: ExternalToolConfig) -> dict:
+    """Summarize an external tool config for API responses."""
+    return {
+        "name": config.name,
+        "description": config.description,
+        "endpoint": config.endpoint_url,
+        "method": config.http_method,
+    }
+
 
+# FastAPI router for runtime tool management. Like the REST API app, it
+# serializes responses with orjson.
+tools_router = APIRouter(
+    prefix="/tools",
+    tags=["Tool Management"],
+    default_response_class=ORJSONResponse,
+)
 
-@tools_router.get("/")
-def list_registered_tools() -> dict:
+
+def _tool_listing() -> tuple[bytes, str]:
+    """
+    Get the serialized /tools/ listing and its ETag, rebuilding them if stale.
+    
+    Returns:
+        The JSON body and its quoted ETag.
+    """
+    global _tool_listing_cache
+    mcp = get_mcp_server()
+    names = tuple(mcp._tool_manager._tools)
+    cache = _tool_listing_cache
+    if (
+        cache is None
+        or cache[0] is not mcp
+        or cache[1] != _tool_gen
+        or cache[2] != names
+    ):
+        payload = orjson.dumps({
+            "total_tools": len(names),
+            "tools": names,
+            "external_tools": list(_external_tools),
+        })
+        etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+        cache = _tool_listing_cache = (mcp, _tool_gen, names, payload, etag)
+    return cache[3], cache[4]
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+    
+    Follows RFC 9110 for GET: "*" matches any current listing, and tags are
+    compared weakly, so a W/ prefix is ignored. The header may list several
+    tags separated by commas.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+@tools_router.get("/", response_model=dict)
+async def list_registered_tools(request: Request) -> Response:
     """
     List all currently registered MCP tools.
     
     Returns both built-in tools and dynamically registered external tools.
+    The response carries an ETag of the listing; a request whose
+    If-None-Match matches it gets an empty 304 instead.
     """
-    mcp = get_mcp_server()
-    tools = list(mcp._tool_manager._tools.keys())
-    return {
-        "total_tools": len(tools),
-        "tools": tools,
-        "external_tools": list(_external_tools.keys()),
-    }
+    payload, etag = _tool_listing()
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(payload, media_type="application/json", headers={"ETag": etag})
 
 
-@tools_router.post("/register")
-def register_external_tool(config: ExternalToolConfig) -> dict:
+def add_external_tool(config: ExternalToolConfig) -> dict:
     """
-    Register a new external REST API as an MCP tool AT RUNTIME.
+    Register an external REST API as an MCP tool on the running server.
     
-    This endpoint allows you to dynamically add new MCP tools while
-    the server is running, without any restart required.
-    
-    The registered tool will immediately be available to MCP clients.
-    FastMCP automatically sends `notifications/tools/list_changed`
-    to connected clients so they can refresh their tool list.
+    This is the logic behind POST /tools/register, callable without going
+    through HTTP.
     
     Args:
         config: The external tool configuration.
         
     Returns:
-        Confirmation of the registered tool.
+        Confirmation of the registered tool and the new total tool count.
+        
+    Raises:
+        HTTPException: 400 if the name is taken or the HTTP method is unsupported.
     """
     mcp = get_mcp_server()
     
@@ -196,26 +317,97 @@ def register_external_tool(config: ExternalToolConfig) -> dict:
         )
     
     # Create and register the tool
-    tool = create_external_api_tool(config)
+    try:
+        tool = create_external_api_tool(config)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     mcp.add_tool(tool)
     
     # Store in our registry
     _external_tools[config.name] = config
+    _bump_tool_gen()
     
     return {
         "status": "success",
         "message": f"Tool '{config.name}' registered successfully",
-        "tool": {
-            "name": config.name,
-            "description": config.description,
-            "endpoint": config.endpoint_url,
-            "method": config.http_method,
-        }
+        "tool": _tool_summary(config),
+        "total_tools": len(mcp._tool_manager._tools),
     }
 
 
-@tools_router.delete("/unregister/{tool_name}")
-def unregister_tool(tool_name: str) -> dict:
+@tools_router.post("/register", response_model=dict)
+async def register_external_tool(config: ExternalToolConfig) -> ORJSONResponse:
+    """
+    Register a new external REST API as an MCP tool AT RUNTIME.
+    
+    This endpoint allows you to dynamically add new MCP tools while
+    the server is running, without any restart required.
+    
+    The registered tool will immediately be available to MCP clients.
+    FastMCP automatically sends `notifications/tools/list_changed`
+    to connected clients so they can refresh their tool list.
+    
+    Args:
+        config: The external tool configuration.
+        
+    Returns:
+        Confirmation of the registered tool and the new total tool count.
+    """
+    return ORJSONResponse(add_external_tool(config))
+
+
+@tools_router.post("/register_batch", response_model=dict)
+async def register_external_tools_batch(configs: list[ExternalToolConfig]) -> ORJSONResponse:
+    """
+    Register several external REST APIs as MCP tools in one request.
+    
+    The whole batch is validated before anything is added, so either
+    every tool is registered or none are. Registering N tools costs one
+    request instead of N.
+    
+    Args:
+        configs: The external tool configurations to register.
+        
+    Returns:
+        Confirmation of the registered tools and the new total tool count.
+    """
+    mcp = get_mcp_server()
+    
+    # Validate the whole batch before registering anything
+    seen: set[str] = set()
+    for config in configs:
+        if config.name in seen:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Tool '{config.name}' appears more than once in the batch"
+            )
+        if config.name in mcp._tool_manager._tools:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Tool '{config.name}' already exists"
+            )
+        seen.add(config.name)
+    
+    try:
+        tools = [create_external_api_tool(config) for config in configs]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    for config, tool in zip(configs, tools):
+        mcp.add_tool(tool)
+        _external_tools[config.name] = config
+    _bump_tool_gen()
+    
+    return ORJSONResponse({
+        "status": "success",
+        "message": f"{len(tools)} tools registered successfully",
+        "tools": [_tool_summary(config) for config in configs],
+        "total_tools": len(mcp._tool_manager._tools),
+    })
+
+
+@tools_router.delete("/unregister/{tool_name}", response_model=dict)
+async def unregister_tool(tool_name: str) -> ORJSONResponse:
     """
     Remove a dynamically registered tool AT RUNTIME.
     
@@ -223,11 +415,12 @@ def unregister_tool(tool_name: str) -> dict:
         tool_name: The name of the tool to remove.
         
     Returns:
-        Confirmation of the removal.
+        Confirmation of the removal and the new total tool count.
     """
     mcp = get_mcp_server()
     
-    if tool_name not in _external_tools:
+    # Remove from our registry in one step; a concurrent duplicate delete gets None
+    if _external_tools.pop(tool_name, None) is None:
         raise HTTPException(
             status_code=404,
             detail=f"Tool '{tool_name}' is not a dynamically registered external tool"
@@ -235,14 +428,62 @@ def unregister_tool(tool_name: str) -> dict:
     
     # Remove from MCP server
     mcp.remove_tool(tool_name)
+    _bump_tool_gen()
     
-    # Remove from our registry
-    del _external_tools[tool_name]
+    return ORJSONResponse({
+        "status": "success",
+        "message": f"Tool '{tool_name}' removed successfully",
+        "total_tools": len(mcp._tool_manager._tools),
+    })
+
+
+@tools_router.post("/unregister_batch", response_model=dict)
+async def unregister_tools_batch(tool_names: list[str]) -> ORJSONResponse:
+    """
+    Remove several dynamically registered tools in one request.
     
-    return {
+    Like /register_batch, the whole batch is checked first, so either
+    every tool is removed or none are.
+    
+    Args:
+        tool_names: The names of the tools to remove.
+        
+    Returns:
+        Confirmation of the removals and the new total tool count.
+    """
+    mcp = get_mcp_server()
+    
+    # Validate the whole batch before removing anything
+    seen: set[str] = set()
+    for tool_name in tool_names:
+        if tool_name in seen:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Tool '{tool_name}' appears more than once in the batch"
+            )
+        if tool_name not in _external_tools:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Tool '{tool_name}' is not a dynamically registered external tool"
+            )
+        if tool_name not in mcp._tool_manager._tools:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Tool '{tool_name}' is no longer on the MCP server"
+            )
+        seen.add(tool_name)
+    
+    for tool_name in tool_names:
+        del _external_tools[tool_name]
+        mcp.remove_tool(tool_name)
+    _bump_tool_gen()
+    
+    return ORJSONResponse({
         "status": "success",
-        "message": f"Tool '{tool_name}' removed successfully"
-    }
+        "message": f"{len(tool_names)} tools removed successfully",
+        "tools": tool_names,
+        "total_tools": len(mcp._tool_manager._tools),
+    })
 
 
 # =============================================================================
@@ -272,7 +513,13 @@ def create_combined_app() -> FastAPI:
     async def combined_lifespan(app: FastAPI):
         """Manage lifecycle of both FastAPI and MCP servers."""
         async with mcp_app.lifespan(app):
-            yield
+            get_http_client()
+            # Serialize the startup tool listing before the first request
+            _tool_listing()
+            try:
+                yield
+            finally:
+                await close_http_client()
     
     # Create the combined FastAPI app
     combined_app = FastAPI(
@@ -318,7 +565,10 @@ def run_http_server(host: str = "127.0.0.1", port: int = 8000):
     print(f"  API docs: http://{host}:{port}/docs")
     
     app = create_combined_app()
-    uvicorn.run(app, host=host, port=port)
+    # The default "auto" loop and HTTP implementations already pick uvloop and
+    # httptools when uvicorn[standard] installed them. Per-request access
+    # logging is off to keep it off the hot path.
+    uvicorn.run(app, host=host, port=port, access_log=False)
 
 
 def run_stdio_server():
@@ -341,6 +591,8 @@ def main():
     - http (default): Dual-protocol server over HTTP
     - stdio: MCP-only server over STDIO
     """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Dynamic MCP Tools Server",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -107,6 +107,11 @@ def register_dynamic_tools(mcp: FastMCP) -> None:
                     "rest_endpoint": "GET /items",
                     "description": "List all items in the inventory",
                 },
+                {
+                    "tool_name": "item_stats",
+                    "rest_endpoint": "GET /items/stats",
+                    "description": "Get item price statistics",
+                },
                 {
                     "tool_name": "get_item", 
                     "rest_endpoint": "GET /items/{item_id}",
@@ -0,0 +1,39 @@
+"""
+Shared pytest configuration for the test suite.
+
+The suite can run in parallel with ``pytest -n auto``. Each xdist worker
+is a separate process that imports ``dynamic_mcp`` afresh and builds its
+own session- and module-scoped fixtures, so module-level state such as
+``_items_db`` and ``_external_tools`` is worker-local. Within a worker,
+tests run one at a time and function-scoped fixtures reset that state.
+"""
+
+import asyncio
+import importlib.util
+
+import pytest
+from fastapi.testclient import TestClient
+
+from dynamic_mcp.main import create_combined_app
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop where it is available."""
+    if importlib.util.find_spec("uvloop") is not None:
+        import uvloop
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def combined_app():
+    """Build the dual-protocol app once for the whole session."""
+    return create_combined_app()
+
+
+@pytest.fixture(scope="session")
+def combined_client(combined_app):
+    """Test client for the combined app, with its lifespan entered once."""
+    with TestClient(combined_app) as test_client:
+        yield test_client
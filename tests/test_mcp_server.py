@@ -10,11 +10,15 @@ Run tests with:
     uv run pytest tests/ -v
 """
 
+import functools
 import pytest
+import pytest_asyncio
 import asyncio
+import httpx
 from fastmcp import Client
 from fastmcp.tools import Tool
 
+from dynamic_mcp import main
 from dynamic_mcp.main import (
     create_mcp_server,
     create_external_api_tool,
@@ -22,19 +26,138 @@ from dynamic_mcp.main import (
 )
 
 
+# Tools generated from the FastAPI routes (Pattern A)
+EXPECTED_FASTAPI_TOOLS = frozenset({
+    "list_items",
+    "create_item",
+    "get_item",
+    "update_item",
+    "delete_item",
+    "calculate",
+    "health_check",
+    "item_stats",
+})
+
+# Tools registered programmatically with add_tool() (Pattern B)
+EXPECTED_DYNAMIC_TOOLS = frozenset({"echo", "server_info", "api_reference"})
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def unwrap(data) -> dict:
+    """Return tool result data as a dict.
+    
+    Depending on the FastMCP version, structured results arrive as a dict,
+    a Pydantic model, or a plain object.
+    """
+    if isinstance(data, dict):
+        return data
+    model_dump = getattr(data, "model_dump", None)
+    return model_dump() if model_dump else vars(data)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_tool(
+    name: str,
+    description: str,
+    endpoint_url: str,
+    http_method: str,
+    tags: tuple[str, ...],
+) -> Tool:
+    return create_external_api_tool(ExternalToolConfig(
+        name=name,
+        description=description,
+        endpoint_url=endpoint_url,
+        http_method=http_method,
+        tags=list(tags),
+    ))
+
+
+def build_tool(config: ExternalToolConfig) -> Tool:
+    """Build an external API tool, reusing one built earlier from an equal config."""
+    return _cached_tool(
+        config.name,
+        config.description,
+        config.endpoint_url,
+        config.http_method,
+        tuple(config.tags),
+    )
+
+
+def register_tools(mcp_server, configs: list[ExternalToolConfig]) -> list[str]:
+    """Register external API tools back to back and return their names."""
+    for config in configs:
+        mcp_server.add_tool(build_tool(config))
+    return [config.name for config in configs]
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mcp_server():
-    """Create a fresh MCP server for each test."""
-    return create_mcp_server()
+    """
+    Create one MCP server shared by every test in this module.
+    
+    create_mcp_server() also makes the new server the global one. Put the
+    previous server back afterwards so the session's combined app keeps
+    managing the server it actually mounts.
+    """
+    previous = main._mcp_server
+    yield create_mcp_server()
+    main._mcp_server = previous
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def mcp_client(mcp_server):
+    """Connect one MCP client to the shared server for the whole module."""
+    async with Client(mcp_server) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def initial_tools(mcp_client):
+    """List the server's startup tools once for the whole module."""
+    return await mcp_client.list_tools()
+
+
+@pytest.fixture(scope="module")
+def initial_tool_names(initial_tools):
+    """Names of the server's startup tools."""
+    return frozenset(t.name for t in initial_tools)
+
+
+@pytest.fixture(autouse=True)
+def restore_tools(mcp_server):
+    """Remove any tools a test added to the shared server."""
+    initial_tools = set(mcp_server._tool_manager._tools)
+    yield
+    for name in set(mcp_server._tool_manager._tools) - initial_tools:
+        mcp_server.remove_tool(name)
 
 
 @pytest.fixture
+def mock_http_client(monkeypatch):
+    """Answer external API calls with a canned JSONPlaceholder post."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={
+            "id": 1,
+            "userId": 1,
+            "title": "Mock post",
+            "body": "Served without touching the network",
+        })
+    
+    monkeypatch.setattr(
+        main, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+@pytest.fixture(scope="session")
 def external_tool_config():
-    """Sample configuration for external API tool."""
+    """Sample configuration for external API tool, shared read-only by all tests."""
     return ExternalToolConfig(
         name="test_external_api",
         description="Test external API tool",
@@ -51,76 +174,61 @@ def external_tool_config():
 class TestFastAPIToMCPConversion:
     """Tests for Pattern A: FastMCP.from_fastapi() conversion."""
 
-    @pytest.mark.asyncio
-    async def test_fastapi_endpoints_converted_to_tools(self, mcp_server):
+    def test_fastapi_endpoints_converted_to_tools(self, initial_tool_names):
         """Verify that FastAPI endpoints are converted to MCP tools."""
-        async with Client(mcp_server) as client:
-            tools = await client.list_tools()
-            tool_names = [t.name for t in tools]
-            
-            # FastAPI endpoints should be available as tools
-            assert "list_items" in tool_names
-            assert "create_item" in tool_names
-            assert "get_item" in tool_names
-            assert "update_item" in tool_names
-            assert "delete_item" in tool_names
-            assert "calculate" in tool_names
-            assert "health_check" in tool_names
-
-    @pytest.mark.asyncio
-    async def test_list_items_tool_returns_items(self, mcp_server):
+        # FastAPI endpoints should be available as tools
+        assert EXPECTED_FASTAPI_TOOLS <= initial_tool_names
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_list_items_tool_returns_items(self, mcp_client):
         """Verify list_items tool returns inventory items."""
-        async with Client(mcp_server) as client:
-            result = await client.call_tool("list_items", {})
-            
-            # Should return a list of items
-            assert isinstance(result.data, list)
-            assert len(result.data) >= 3  # Initial items
-
-    @pytest.mark.asyncio
-    async def test_calculate_tool_performs_operations(self, mcp_server):
+        result = await mcp_client.call_tool("list_items", {})
+        
+        # Should return a list of items
+        assert isinstance(result.data, list)
+        assert len(result.data) >= 3  # Initial items
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_calculate_tool_performs_operations(self, mcp_client):
         """Verify calculate tool performs arithmetic correctly."""
-        async with Client(mcp_server) as client:
-            # Test addition
-            result = await client.call_tool("calculate", {
-                "operation": "add",
-                "a": 10,
-                "b": 5,
-            })
-            # Result may be a Pydantic object or dict depending on FastMCP version
-            data = result.data if isinstance(result.data, dict) else result.data.model_dump() if hasattr(result.data, 'model_dump') else vars(result.data)
-            assert data["result"] == 15
-            
-            # Test multiplication
-            result = await client.call_tool("calculate", {
-                "operation": "multiply",
-                "a": 7,
-                "b": 8,
-            })
-            data = result.data if isinstance(result.data, dict) else result.data.model_dump() if hasattr(result.data, 'model_dump') else vars(result.data)
-            assert data["result"] == 56
-
-    @pytest.mark.asyncio
-    async def test_create_and_get_item(self, mcp_server):
+        # Test addition
+        result = await mcp_client.call_tool("calculate", {
+            "operation": "add",
+            "a": 10,
+            "b": 5,
+        })
+        data = unwrap(result.data)
+        assert data["result"] == 15
+        
+        # Test multiplication
+        result = await mcp_client.call_tool("calculate", {
+            "operation": "multiply",
+            "a": 7,
+            "b": 8,
+        })
+        data = unwrap(result.data)
+        assert data["result"] == 56
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_create_and_get_item(self, mcp_client):
         """Verify create_item and get_item tools work together."""
-        async with Client(mcp_server) as client:
-            # Create a new item
-            result = await client.call_tool("create_item", {
-                "name": "Test Widget",
-                "price": 99.99,
-                "description": "A test widget",
-            })
-            
-            # Handle Pydantic object or dict response
-            data = result.data if isinstance(result.data, dict) else result.data.model_dump() if hasattr(result.data, 'model_dump') else vars(result.data)
-            assert data["name"] == "Test Widget"
-            assert data["price"] == 99.99
-            created_id = data["id"]
-            
-            # Retrieve the created item
-            result = await client.call_tool("get_item", {"item_id": created_id})
-            data = result.data if isinstance(result.data, dict) else result.data.model_dump() if hasattr(result.data, 'model_dump') else vars(result.data)
-            assert data["name"] == "Test Widget"
+        # Create a new item
+        result = await mcp_client.call_tool("create_item", {
+            "name": "Test Widget",
+            "price": 99.99,
+            "description": "A test widget",
+        })
+        
+        # Handle Pydantic object or dict response
+        data = unwrap(result.data)
+        assert data["name"] == "Test Widget"
+        assert data["price"] == 99.99
+        created_id = data["id"]
+        
+        # Retrieve the created item
+        result = await mcp_client.call_tool("get_item", {"item_id": created_id})
+        data = unwrap(result.data)
+        assert data["name"] == "Test Widget"
 
 
 # =============================================================================
@@ -130,34 +238,25 @@ class TestFastAPIToMCPConversion:
 class TestProgrammaticToolRegistration:
     """Tests for Pattern B: mcp.add_tool() programmatic registration."""
 
-    @pytest.mark.asyncio
-    async def test_dynamic_tools_registered(self, mcp_server):
+    def test_dynamic_tools_registered(self, initial_tool_names):
         """Verify dynamically registered tools are available."""
-        async with Client(mcp_server) as client:
-            tools = await client.list_tools()
-            tool_names = [t.name for t in tools]
-            
-            # Dynamic tools should be registered
-            assert "echo" in tool_names
-            assert "server_info" in tool_names
-            assert "api_reference" in tool_names
-
-    @pytest.mark.asyncio
-    async def test_echo_tool_echoes_message(self, mcp_server):
+        # Dynamic tools should be registered
+        assert EXPECTED_DYNAMIC_TOOLS <= initial_tool_names
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_echo_tool_echoes_message(self, mcp_client):
         """Verify echo tool returns the input message."""
-        async with Client(mcp_server) as client:
-            result = await client.call_tool("echo", {"message": "Hello, MCP!"})
-            assert "Hello, MCP!" in str(result.data)
+        result = await mcp_client.call_tool("echo", {"message": "Hello, MCP!"})
+        assert result.data == "Echo: Hello, MCP!"
 
-    @pytest.mark.asyncio
-    async def test_server_info_tool_returns_metadata(self, mcp_server):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_server_info_tool_returns_metadata(self, mcp_client):
         """Verify server_info tool returns server metadata."""
-        async with Client(mcp_server) as client:
-            result = await client.call_tool("server_info", {})
-            
-            assert result.data["name"] == "Dynamic MCP Tools Server"
-            assert result.data["version"] == "0.1.0"
-            assert "patterns_demonstrated" in result.data
+        result = await mcp_client.call_tool("server_info", {})
+        
+        assert result.data["name"] == "Dynamic MCP Tools Server"
+        assert result.data["version"] == "0.1.0"
+        assert "patterns_demonstrated" in result.data
 
 
 # =============================================================================
@@ -180,6 +279,20 @@ class TestRuntimeToolRegistration:
         assert config.name == "valid_tool"
         assert config.http_method == "POST"
 
+    def test_external_tool_config_interns_tags(self):
+        """Verify equal tags from separate configs are the same string object."""
+        configs = [
+            ExternalToolConfig(
+                name=f"tool_{i}",
+                description="Tagged tool",
+                endpoint_url=f"https://api.example.com/{i}",
+                tags=["".join(["shared", "_tag"])],  # A fresh str object per config
+            )
+            for i in range(2)
+        ]
+        
+        assert configs[0].tags[0] is configs[1].tags[0]
+
     def test_create_external_api_tool_returns_tool(self, external_tool_config):
         """Verify create_external_api_tool creates a valid Tool object."""
         tool = create_external_api_tool(external_tool_config)
@@ -189,72 +302,138 @@ class TestRuntimeToolRegistration:
         assert "test" in tool.tags
         assert "external" in tool.tags
 
-    @pytest.mark.asyncio
-    async def test_runtime_tool_registration(self, mcp_server, external_tool_config):
+    def test_create_external_api_tool_rejects_unsupported_method(self):
+        """Verify unsupported HTTP methods fail at creation, not at call time."""
+        config = ExternalToolConfig(
+            name="patch_tool",
+            description="A tool with an unsupported method",
+            endpoint_url="https://api.example.com/data",
+            http_method="PATCH",
+        )
+        
+        with pytest.raises(ValueError, match="Unsupported HTTP method"):
+            create_external_api_tool(config)
+
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("method,query,body", [
+        ("GET", b"userId=1", b""),
+        ("POST", b"", b'{"userId":1}'),
+        ("PUT", b"", b'{"userId":1}'),
+        ("DELETE", b"userId=1", b""),
+    ])
+    async def test_external_api_tool_sends_params_for_method(
+        self, monkeypatch, method, query, body
+    ):
+        """Verify params go in the query string or JSON body depending on the method."""
+        requests = []
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={})
+        
+        monkeypatch.setattr(
+            main, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        tool = create_external_api_tool(ExternalToolConfig(
+            name=f"{method.lower()}_tool",
+            description=f"{method} method tool",
+            endpoint_url="https://api.example.com/posts",
+            http_method=method,
+        ))
+        
+        await tool.run({"params": {"userId": 1}})
+        
+        (request,) = requests
+        assert request.method == method
+        assert request.url.query == query
+        assert request.content.replace(b" ", b"") == body
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_runtime_tool_registration(
+        self, mcp_client, mcp_server, initial_tools, external_tool_config
+    ):
         """Verify tools can be registered at runtime."""
-        async with Client(mcp_server) as client:
-            # Get initial tool count
-            initial_tools = await client.list_tools()
-            initial_count = len(initial_tools)
-            
-            # Register a new tool at runtime
-            new_tool = create_external_api_tool(external_tool_config)
-            mcp_server.add_tool(new_tool)
-            
-            # Verify tool count increased
-            updated_tools = await client.list_tools()
-            assert len(updated_tools) == initial_count + 1
-            
-            # Verify new tool is in the list
-            tool_names = [t.name for t in updated_tools]
-            assert "test_external_api" in tool_names
-
-    @pytest.mark.asyncio
-    async def test_runtime_tool_removal(self, mcp_server, external_tool_config):
+        initial_count = len(initial_tools)
+        
+        # Register a new tool at runtime
+        new_tool = build_tool(external_tool_config)
+        mcp_server.add_tool(new_tool)
+        
+        # Verify tool count increased
+        updated_tools = await mcp_client.list_tools()
+        assert len(updated_tools) == initial_count + 1
+        
+        # Verify new tool is in the list
+        tool_names = [t.name for t in updated_tools]
+        assert "test_external_api" in tool_names
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_runtime_tool_removal(self, mcp_client, mcp_server, external_tool_config):
         """Verify tools can be removed at runtime."""
-        async with Client(mcp_server) as client:
-            # Register a tool
-            new_tool = create_external_api_tool(external_tool_config)
-            mcp_server.add_tool(new_tool)
-            
-            tools_after_add = await client.list_tools()
-            count_after_add = len(tools_after_add)
-            
-            # Remove the tool
-            mcp_server.remove_tool(external_tool_config.name)
-            
-            # Verify tool count decreased
-            tools_after_remove = await client.list_tools()
-            assert len(tools_after_remove) == count_after_add - 1
-            
-            # Verify tool is no longer in list
-            tool_names = [t.name for t in tools_after_remove]
-            assert external_tool_config.name not in tool_names
-
-    @pytest.mark.asyncio
-    async def test_runtime_registered_tool_is_callable(self, mcp_server):
+        # Register a tool
+        new_tool = build_tool(external_tool_config)
+        mcp_server.add_tool(new_tool)
+        
+        tools_after_add = await mcp_client.list_tools()
+        count_after_add = len(tools_after_add)
+        
+        # Remove the tool
+        mcp_server.remove_tool(external_tool_config.name)
+        
+        # Verify tool count decreased
+        tools_after_remove = await mcp_client.list_tools()
+        assert len(tools_after_remove) == count_after_add - 1
+        
+        # Verify tool is no longer in list
+        tool_names = [t.name for t in tools_after_remove]
+        assert external_tool_config.name not in tool_names
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_runtime_registered_tool_is_callable(
+        self, mcp_client, mcp_server, mock_http_client
+    ):
         """Verify dynamically registered tools can be called."""
-        async with Client(mcp_server) as client:
-            # Register a tool that calls JSONPlaceholder API
-            config = ExternalToolConfig(
-                name="get_post",
-                description="Fetch a post from JSONPlaceholder",
-                endpoint_url="https://jsonplaceholder.typicode.com/posts/1",
-                http_method="GET",
-            )
-            tool = create_external_api_tool(config)
-            mcp_server.add_tool(tool)
-            
-            # Call the dynamically registered tool
-            result = await client.call_tool("get_post", {})
-            
-            # Verify it returned data from JSONPlaceholder
-            assert result.data["id"] == 1
-            assert result.data["userId"] == 1
-            assert "title" in result.data
-            
-            # Cleanup
-            mcp_server.remove_tool("get_post")
+        # Register a tool that calls JSONPlaceholder API
+        config = ExternalToolConfig(
+            name="get_post",
+            description="Fetch a post from JSONPlaceholder",
+            endpoint_url="https://jsonplaceholder.typicode.com/posts/1",
+            http_method="GET",
+        )
+        tool = build_tool(config)
+        mcp_server.add_tool(tool)
+        
+        # Call the dynamically registered tool
+        result = await mcp_client.call_tool("get_post", {})
+        
+        # Verify it returned data from JSONPlaceholder
+        assert result.data["id"] == 1
+        assert result.data["userId"] == 1
+        assert "title" in result.data
+        
+        # Cleanup
+        mcp_server.remove_tool("get_post")
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_runtime_registered_tool_calls_live_api(self, mcp_client, mcp_server, monkeypatch):
+        """Verify a registered tool can reach the real JSONPlaceholder API."""
+        mcp_server.add_tool(build_tool(ExternalToolConfig(
+            name="get_live_post",
+            description="Fetch a post from JSONPlaceholder",
+            endpoint_url="https://jsonplaceholder.typicode.com/posts/1",
+            http_method="GET",
+        )))
+        
+        # Use a client of our own rather than the shared one, which may belong
+        # to the session's combined app
+        async with httpx.AsyncClient(timeout=httpx.Timeout(5.0)) as http_client:
+            monkeypatch.setattr(main, "_http_client", http_client)
+            result = await mcp_client.call_tool("get_live_post", {})
+        
+        assert result.data["id"] == 1
+        assert result.data["userId"] == 1
+        assert "title" in result.data
 
 
 # =============================================================================
@@ -264,46 +443,33 @@ class TestRuntimeToolRegistration:
 class TestServerState:
     """Tests for overall server state and tool management."""
 
-    @pytest.mark.asyncio
-    async def test_initial_tool_count(self, mcp_server):
+    def test_initial_tool_count(self, initial_tools):
         """Verify the expected number of initial tools."""
-        async with Client(mcp_server) as client:
-            tools = await client.list_tools()
-            # Should have 10 tools: 7 from FastAPI + 3 from dynamic registration
-            assert len(tools) == 10
+        # Should have 11 tools: 8 from FastAPI + 3 from dynamic registration
+        assert len(initial_tools) == 11
 
-    @pytest.mark.asyncio
-    async def test_tool_descriptions_populated(self, mcp_server):
+    def test_tool_descriptions_populated(self, initial_tools):
         """Verify all tools have descriptions for LLMs."""
-        async with Client(mcp_server) as client:
-            tools = await client.list_tools()
-            
-            for tool in tools:
-                assert tool.description, f"Tool {tool.name} missing description"
-                assert len(tool.description) > 10, f"Tool {tool.name} has too short description"
-
-    @pytest.mark.asyncio
-    async def test_multiple_runtime_registrations(self, mcp_server):
+        for tool in initial_tools:
+            assert tool.description, f"Tool {tool.name} missing description"
+            assert len(tool.description) > 10, f"Tool {tool.name} has too short description"
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_multiple_runtime_registrations(
+        self, mcp_client, mcp_server, initial_tool_names
+    ):
         """Verify multiple tools can be registered at runtime."""
-        async with Client(mcp_server) as client:
-            initial_tools = await client.list_tools()
-            initial_count = len(initial_tools)
-            
-            # Register multiple tools
-            for i in range(3):
-                config = ExternalToolConfig(
-                    name=f"test_tool_{i}",
-                    description=f"Test tool number {i}",
-                    endpoint_url=f"https://jsonplaceholder.typicode.com/posts/{i+1}",
-                    http_method="GET",
-                )
-                tool = create_external_api_tool(config)
-                mcp_server.add_tool(tool)
-            
-            # Verify all were added
-            updated_tools = await client.list_tools()
-            assert len(updated_tools) == initial_count + 3
-            
-            # Cleanup
-            for i in range(3):
-                mcp_server.remove_tool(f"test_tool_{i}")
+        # Register multiple tools
+        names = register_tools(mcp_server, [
+            ExternalToolConfig(
+                name=f"test_tool_{i}",
+                description=f"Test tool number {i}",
+                endpoint_url=f"https://jsonplaceholder.typicode.com/posts/{i+1}",
+                http_method="GET",
+            )
+            for i in range(3)
+        ])
+        
+        # Verify all were added with a single listing
+        updated_tools = await mcp_client.list_tools()
+        assert {t.name for t in updated_tools} - initial_tool_names == set(names)
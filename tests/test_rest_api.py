@@ -9,9 +9,18 @@ Run tests with:
 """
 
 import pytest
-from fastapi.testclient import TestClient
 
-from dynamic_mcp.api.routes import app, _items_db
+from dynamic_mcp.api.routes import (
+    ItemResponse,
+    ItemStore,
+    _items_db,
+    _refresh_cache,
+)
+
+
+# Pristine inventory captured once at import. ItemStore keeps plain column
+# values, so restoring from it never shares state with a test's writes.
+_PRISTINE_ITEMS = _items_db.copy()
 
 
 # =============================================================================
@@ -19,24 +28,20 @@ from dynamic_mcp.api.routes import app, _items_db
 # =============================================================================
 
 @pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+def client(combined_client):
+    """Test client for the REST API, served by the session's combined app."""
+    return combined_client
 
 
 @pytest.fixture(autouse=True)
 def reset_database():
-    """Reset the in-memory database before each test."""
-    from dynamic_mcp.api.routes import _items_db, ItemResponse
-    
-    # Store original state
-    original_items = dict(_items_db)
-    
+    """Reset the in-memory database after each test."""
     yield
     
     # Restore original state after test
     _items_db.clear()
-    _items_db.update(original_items)
+    _items_db.update(_PRISTINE_ITEMS)
+    _refresh_cache()
 
 
 # =============================================================================
@@ -72,6 +77,33 @@ class TestItemCRUD:
         assert isinstance(items, list)
         assert len(items) >= 3  # Initial seed data
 
+    def test_list_items_reflects_writes(self, client):
+        """Verify the cached list payload is refreshed after create and delete."""
+        initial_count = len(client.get("/items").json())
+        
+        created = client.post("/items", json={"name": "Cached", "price": 1.0}).json()
+        items = client.get("/items").json()
+        assert len(items) == initial_count + 1
+        assert created["id"] in [item["id"] for item in items]
+        
+        client.delete(f"/items/{created['id']}")
+        assert len(client.get("/items").json()) == initial_count
+
+    def test_item_stats(self, client):
+        """Verify item_stats aggregates prices across all items."""
+        items = client.get("/items").json()
+        prices = [item["price"] for item in items]
+        
+        response = client.get("/items/stats")
+        
+        assert response.status_code == 200
+        stats = response.json()
+        assert stats["count"] == len(items)
+        assert stats["total"] == pytest.approx(sum(prices))
+        assert stats["mean"] == pytest.approx(sum(prices) / len(prices))
+        assert stats["min"] == min(prices)
+        assert stats["max"] == max(prices)
+
     def test_get_item_returns_specific_item(self, client):
         """Verify get_item returns the requested item."""
         response = client.get("/items/1")
@@ -172,59 +204,67 @@ class TestItemCRUD:
 
 
 # =============================================================================
-# Calculate Endpoint Tests
+# Item Store Tests
 # =============================================================================
 
-class TestCalculate:
-    """Tests for calculation endpoint."""
+class TestItemStore:
+    """Tests for the columnar in-memory item store."""
 
-    def test_calculate_add(self, client):
-        """Verify addition operation."""
-        response = client.post("/calculate", json={
-            "operation": "add",
-            "a": 10,
-            "b": 5,
-        })
+    def test_delete_middle_row_keeps_lookups_consistent(self):
+        """Verify deleting a row moves the last row and keeps id lookups valid."""
+        store = ItemStore([
+            ItemResponse(id=1, name="A", price=1.0),
+            ItemResponse(id=2, name="B", price=2.0),
+            ItemResponse(id=3, name="C", description="last", price=3.0),
+        ])
         
-        assert response.status_code == 200
-        result = response.json()
-        assert result["result"] == 15
-
-    def test_calculate_subtract(self, client):
-        """Verify subtraction operation."""
-        response = client.post("/calculate", json={
-            "operation": "subtract",
-            "a": 10,
-            "b": 3,
-        })
+        del store[1]
         
-        assert response.status_code == 200
-        result = response.json()
-        assert result["result"] == 7
-
-    def test_calculate_multiply(self, client):
-        """Verify multiplication operation."""
-        response = client.post("/calculate", json={
-            "operation": "multiply",
-            "a": 6,
-            "b": 7,
-        })
+        assert len(store) == 2
+        assert 1 not in store
+        assert store.row(3) == {"id": 3, "name": "C", "description": "last", "price": 3.0}
+        assert store[2].name == "B"
+        assert sorted(row["id"] for row in store.rows()) == [2, 3]
+        assert store.price_stats()["total"] == 5.0
+        assert [item_id for item_id, _ in store.items()] == [row["id"] for row in store.rows()]
+        assert [item.name for item in store.values()] == ["C", "B"]
+
+    def test_copy_is_independent(self):
+        """Verify a copied store does not see later writes to the original."""
+        store = ItemStore([ItemResponse(id=1, name="A", price=1.0)])
+        snapshot = store.copy()
         
-        assert response.status_code == 200
-        result = response.json()
-        assert result["result"] == 42
+        store[1] = ItemResponse(id=1, name="A2", price=2.0)
+        store[2] = ItemResponse(id=2, name="B", price=3.0)
+        
+        assert snapshot.rows() == [{"id": 1, "name": "A", "description": None, "price": 1.0}]
+        assert 2 not in snapshot
+
+
+# =============================================================================
+# Calculate Endpoint Tests
+# =============================================================================
 
-    def test_calculate_divide(self, client):
-        """Verify division operation."""
+class TestCalculate:
+    """Tests for calculation endpoint."""
+
+    @pytest.mark.parametrize("operation,a,b,expected", [
+        ("add", 10, 5, 15),
+        ("subtract", 10, 3, 7),
+        ("multiply", 6, 7, 42),
+        ("divide", 20, 4, 5.0),
+    ])
+    def test_calculate_operation(self, client, operation, a, b, expected):
+        """Verify each arithmetic operation."""
         response = client.post("/calculate", json={
-            "operation": "divide",
-            "a": 20,
-            "b": 4,
+            "operation": operation,
+            "a": a,
+            "b": b,
         })
         
         assert response.status_code == 200
         result = response.json()
-        assert result["result"] == 5.0
+        assert result["result"] == expected
 
     def test_calculate_divide_by_zero(self, client):
         """Verify division by zero returns error."""
@@ -246,3 +286,6 @@ class TestCalculate:
         })
         
         assert response.status_code == 422  # Validation error
+        error = response.json()["detail"][0]
+        assert error["type"] == "literal_error"
+        assert error["msg"] == "Input should be 'add', 'subtract', 'multiply' or 'divide'"
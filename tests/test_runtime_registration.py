@@ -10,30 +10,121 @@ Run tests with:
 """
 
 import pytest
-from fastapi.testclient import TestClient
 
 from dynamic_mcp.main import (
-    create_combined_app,
+    ExternalToolConfig,
+    add_external_tool,
+    create_external_api_tool,
+    get_mcp_server,
+    _bump_tool_gen,
     _external_tools,
 )
 
 
+# =============================================================================
+# Tool Configurations
+# =============================================================================
+
+# Request bodies shared by the multi-tool tests. They are built once at
+# import and never mutated; TestClient serializes them on each request.
+
+LIFECYCLE_TOOL_NAMES = tuple(f"lifecycle_tool_{i}" for i in range(3))
+
+LIFECYCLE_TOOLS = tuple(
+    {
+        "name": name,
+        "description": f"Lifecycle test tool {i}",
+        "endpoint_url": f"https://api.example.com/{i}",
+        "http_method": "GET",
+    }
+    for i, name in enumerate(LIFECYCLE_TOOL_NAMES)
+)
+
+POST_PAYLOAD_TOOLS = (
+    {
+        "name": "create_comment",
+        "description": "Create a comment with postId, name, email, and body",
+        "endpoint_url": "https://jsonplaceholder.typicode.com/comments",
+        "http_method": "POST",
+        "tags": ["create", "comment"],
+    },
+    {
+        "name": "create_album",
+        "description": "Create an album with userId and title",
+        "endpoint_url": "https://jsonplaceholder.typicode.com/albums",
+        "http_method": "POST",
+        "tags": ["create", "album"],
+    },
+    {
+        "name": "create_todo",
+        "description": "Create a todo with userId, title, and completed status",
+        "endpoint_url": "https://jsonplaceholder.typicode.com/todos",
+        "http_method": "POST",
+        "tags": ["create", "todo"],
+    },
+)
+
+POSTS_URL = "https://jsonplaceholder.typicode.com/posts"
+
+CRUD_TOOLS = (
+    {
+        "name": "posts_list",
+        "description": "List all posts",
+        "endpoint_url": POSTS_URL,
+        "http_method": "GET",
+        "tags": ["posts", "read"],
+    },
+    {
+        "name": "posts_create",
+        "description": "Create a new post with title, body, and userId",
+        "endpoint_url": POSTS_URL,
+        "http_method": "POST",
+        "tags": ["posts", "create"],
+    },
+    {
+        "name": "posts_update",
+        "description": "Update post with id=1 with new title and body",
+        "endpoint_url": f"{POSTS_URL}/1",
+        "http_method": "PUT",
+        "tags": ["posts", "update"],
+    },
+    {
+        "name": "posts_delete",
+        "description": "Delete post with id=1",
+        "endpoint_url": f"{POSTS_URL}/1",
+        "http_method": "DELETE",
+        "tags": ["posts", "delete"],
+    },
+)
+
+MIXED_TOOLS = (
+    {"name": "get_data", "description": "Get data", "endpoint_url": "https://example.com/data", "http_method": "GET"},
+    {"name": "post_data", "description": "Post data", "endpoint_url": "https://example.com/data", "http_method": "POST"},
+    {"name": "get_users", "description": "Get users", "endpoint_url": "https://example.com/users", "http_method": "GET"},
+    {"name": "post_users", "description": "Post users", "endpoint_url": "https://example.com/users", "http_method": "POST"},
+)
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 @pytest.fixture
-def client():
-    """Create a test client for the combined app."""
-    app = create_combined_app()
-    return TestClient(app)
+def client(combined_client):
+    """Test client for the session's combined app."""
+    return combined_client
 
 
 @pytest.fixture(autouse=True)
-def cleanup_external_tools():
-    """Clean up external tools registry after each test."""
+def cleanup_external_tools(client):
+    """Remove any tools a test registered on the shared server."""
+    mcp = get_mcp_server()
+    initial_tools = set(mcp._tool_manager._tools)
     yield
+    for name in set(mcp._tool_manager._tools) - initial_tools:
+        mcp.remove_tool(name)
     _external_tools.clear()
+    _bump_tool_gen()
 
 
 # =============================================================================
@@ -52,7 +143,45 @@ class TestToolManagementEndpoints:
         assert "total_tools" in data
         assert "tools" in data
         assert "external_tools" in data
-        assert data["total_tools"] == 10  # Initial tool count
+        assert data["total_tools"] == 11  # Initial tool count
+
+    def test_list_tools_etag_revalidation(self, client):
+        """Verify an unchanged listing answers If-None-Match with 304."""
+        etag = client.get("/tools/").headers["etag"]
+        
+        response = client.get("/tools/", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    @pytest.mark.parametrize("header", [
+        "*",
+        "W/{etag}",
+        '"stale", {etag}',
+    ], ids=["wildcard", "weak", "list"])
+    def test_list_tools_etag_header_forms(self, client, header):
+        """Verify wildcard, weak and listed If-None-Match values are honored."""
+        etag = client.get("/tools/").headers["etag"]
+        
+        response = client.get("/tools/", headers={"If-None-Match": header.format(etag=etag)})
+        
+        assert response.status_code == 304
+
+    def test_list_tools_etag_changes_after_registration(self, client):
+        """Verify registering a tool invalidates the listing's ETag."""
+        etag = client.get("/tools/").headers["etag"]
+        client.post("/tools/register", json={
+            "name": "etag_tool",
+            "description": "Changes the listing",
+            "endpoint_url": "https://api.example.com/etag",
+        })
+        
+        response = client.get("/tools/", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert "etag_tool" in response.json()["external_tools"]
 
     def test_register_external_tool(self, client):
         """Verify POST /tools/register adds a new tool."""
@@ -92,6 +221,47 @@ class TestToolManagementEndpoints:
         assert "new_tool" in updated["tools"]
         assert "new_tool" in updated["external_tools"]
 
+    def test_list_tools_sees_tools_added_on_server(self, client):
+        """Verify the cached listing picks up tools added directly via add_tool()."""
+        initial_count = client.get("/tools/").json()["total_tools"]
+        
+        get_mcp_server().add_tool(create_external_api_tool(ExternalToolConfig(
+            name="direct_tool",
+            description="Added without the REST API",
+            endpoint_url="https://api.example.com/direct",
+        )))
+        
+        tools = client.get("/tools/").json()
+        assert tools["total_tools"] == initial_count + 1
+        assert "direct_tool" in tools["tools"]
+        assert "direct_tool" not in tools["external_tools"]
+
+    def test_list_tools_sees_tools_swapped_on_server(self, client):
+        """Verify the cached listing and its ETag change when a direct swap keeps the count."""
+        mcp = get_mcp_server()
+        mcp.add_tool(create_external_api_tool(ExternalToolConfig(
+            name="swap_out",
+            description="Removed directly",
+            endpoint_url="https://api.example.com/out",
+        )))
+        before = client.get("/tools/")
+        assert "swap_out" in before.json()["tools"]
+        etag = before.headers["etag"]
+        
+        mcp.remove_tool("swap_out")
+        mcp.add_tool(create_external_api_tool(ExternalToolConfig(
+            name="swap_in",
+            description="Added directly",
+            endpoint_url="https://api.example.com/in",
+        )))
+        
+        response = client.get("/tools/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        tools = response.json()["tools"]
+        assert "swap_in" in tools
+        assert "swap_out" not in tools
+
     def test_register_duplicate_tool_fails(self, client):
         """Verify registering a duplicate tool name returns error."""
         config = {
@@ -110,6 +280,18 @@ class TestToolManagementEndpoints:
         assert response.status_code == 400
         assert "already exists" in response.json()["detail"]
 
+    def test_register_invalid_body_fails(self, client):
+        """Verify malformed or incomplete configs return FastAPI-style 422 errors."""
+        response = client.post("/tools/register", json={"name": "incomplete_tool"})
+        
+        assert response.status_code == 422
+        locs = [error["loc"] for error in response.json()["detail"]]
+        assert ["body", "description"] in locs
+        assert ["body", "endpoint_url"] in locs
+        
+        response = client.post("/tools/register", content=b"{not json")
+        assert response.status_code == 422
+
     def test_unregister_tool(self, client):
         """Verify DELETE /tools/unregister removes a tool."""
         # First register a tool
@@ -151,67 +333,155 @@ class TestToolManagementEndpoints:
 
 
 # =============================================================================
-# HTTP Method Support Tests
+# Batch Registration Tests
 # =============================================================================
 
-class TestHTTPMethodSupport:
-    """Tests for different HTTP methods in external tools."""
+class TestBatchRegistration:
+    """Tests for POST /tools/register_batch and /tools/unregister_batch."""
 
-    def test_register_get_tool(self, client):
-        """Verify GET method tools can be registered."""
-        config = {
-            "name": "get_tool",
-            "description": "GET method tool",
-            "endpoint_url": "https://jsonplaceholder.typicode.com/posts",
-            "http_method": "GET",
-        }
+    def test_register_batch(self, client):
+        """Verify a batch of tools is registered in one request."""
+        initial_count = client.get("/tools/").json()["total_tools"]
+        configs = [
+            {
+                "name": f"batch_tool_{i}",
+                "description": f"Batch tool {i}",
+                "endpoint_url": f"https://api.example.com/{i}",
+                "http_method": "GET",
+            }
+            for i in range(3)
+        ]
         
-        response = client.post("/tools/register", json=config)
+        response = client.post("/tools/register_batch", json=configs)
         
         assert response.status_code == 200
-        assert response.json()["tool"]["method"] == "GET"
+        assert [t["name"] for t in response.json()["tools"]] == [c["name"] for c in configs]
+        tools = client.get("/tools/").json()
+        assert tools["total_tools"] == initial_count + 3
 
-    def test_register_post_tool(self, client):
-        """Verify POST method tools can be registered."""
-        config = {
-            "name": "post_tool",
-            "description": "POST method tool",
-            "endpoint_url": "https://jsonplaceholder.typicode.com/posts",
-            "http_method": "POST",
-        }
+    def test_register_batch_is_all_or_nothing(self, client):
+        """Verify a batch with an invalid entry registers none of its tools."""
+        initial_count = client.get("/tools/").json()["total_tools"]
+        configs = [
+            {
+                "name": "batch_ok",
+                "description": "Valid tool",
+                "endpoint_url": "https://api.example.com/ok",
+                "http_method": "GET",
+            },
+            {
+                "name": "echo",  # Built-in tool name
+                "description": "Clashing tool",
+                "endpoint_url": "https://api.example.com/echo",
+                "http_method": "GET",
+            },
+        ]
         
-        response = client.post("/tools/register", json=config)
+        response = client.post("/tools/register_batch", json=configs)
+        
+        assert response.status_code == 400
+        assert "already exists" in response.json()["detail"]
+        assert client.get("/tools/").json()["total_tools"] == initial_count
+
+    def test_register_batch_invalid_body_fails(self, client):
+        """Verify a batch with an invalid config is rejected with 422."""
+        response = client.post("/tools/register_batch", json=[
+            {"name": "incomplete_tool", "description": "Missing its endpoint"},
+        ])
+        
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", 0, "endpoint_url"]
+
+    def test_unregister_batch(self, client):
+        """Verify a batch of tools is removed in one request."""
+        initial_count = client.get("/tools/").json()["total_tools"]
+        names = [f"batch_tool_{i}" for i in range(3)]
+        client.post("/tools/register_batch", json=[
+            {"name": name, "description": name, "endpoint_url": "https://api.example.com"}
+            for name in names
+        ])
+        
+        response = client.post("/tools/unregister_batch", json=names)
         
         assert response.status_code == 200
-        assert response.json()["tool"]["method"] == "POST"
+        assert response.json()["tools"] == names
+        tools = client.get("/tools/").json()
+        assert tools["total_tools"] == initial_count
+        assert tools["external_tools"] == []
+
+    def test_unregister_batch_is_all_or_nothing(self, client):
+        """Verify a batch naming a built-in tool removes none of its tools."""
+        client.post("/tools/register", json={
+            "name": "batch_keep",
+            "description": "Survives the failed batch",
+            "endpoint_url": "https://api.example.com/keep",
+        })
+        
+        response = client.post("/tools/unregister_batch", json=["batch_keep", "echo"])
+        
+        assert response.status_code == 404
+        assert "batch_keep" in client.get("/tools/").json()["external_tools"]
 
-    def test_register_put_tool(self, client):
-        """Verify PUT method tools can be registered."""
+    def test_unregister_batch_with_tool_missing_from_server(self, client):
+        """Verify a tool removed directly on the server fails the whole batch."""
+        names = ["batch_a", "batch_b", "batch_c"]
+        client.post("/tools/register_batch", json=[
+            {
+                "name": name,
+                "description": f"Batch tool {name}",
+                "endpoint_url": f"https://api.example.com/{name}",
+            }
+            for name in names
+        ])
+        get_mcp_server().remove_tool("batch_b")
+        
+        response = client.post("/tools/unregister_batch", json=names)
+        
+        assert response.status_code == 404
+        assert set(names) <= set(client.get("/tools/").json()["external_tools"])
+        assert {"batch_a", "batch_c"} <= set(get_mcp_server()._tool_manager._tools)
+
+
+# =============================================================================
+# HTTP Method Support Tests
+# =============================================================================
+
+class TestHTTPMethodSupport:
+    """Tests for different HTTP methods in external tools."""
+
+    @pytest.mark.parametrize("method,url", [
+        ("GET", "https://jsonplaceholder.typicode.com/posts"),
+        ("POST", "https://jsonplaceholder.typicode.com/posts"),
+        ("PUT", "https://jsonplaceholder.typicode.com/posts/1"),
+        ("DELETE", "https://jsonplaceholder.typicode.com/posts/1"),
+    ])
+    def test_register_method_tool(self, client, method, url):
+        """Verify tools can be registered for each supported HTTP method."""
         config = {
-            "name": "put_tool",
-            "description": "PUT method tool",
-            "endpoint_url": "https://jsonplaceholder.typicode.com/posts/1",
-            "http_method": "PUT",
+            "name": f"{method.lower()}_tool",
+            "description": f"{method} method tool",
+            "endpoint_url": url,
+            "http_method": method,
         }
         
         response = client.post("/tools/register", json=config)
         
         assert response.status_code == 200
-        assert response.json()["tool"]["method"] == "PUT"
+        assert response.json()["tool"]["method"] == method
 
-    def test_register_delete_tool(self, client):
-        """Verify DELETE method tools can be registered."""
+    def test_register_unsupported_method_fails(self, client):
+        """Verify unsupported HTTP methods are rejected at registration."""
         config = {
-            "name": "delete_tool",
-            "description": "DELETE method tool",
+            "name": "patch_tool",
+            "description": "PATCH method tool",
             "endpoint_url": "https://jsonplaceholder.typicode.com/posts/1",
-            "http_method": "DELETE",
+            "http_method": "PATCH",
         }
         
         response = client.post("/tools/register", json=config)
         
-        assert response.status_code == 200
-        assert response.json()["tool"]["method"] == "DELETE"
+        assert response.status_code == 400
+        assert "Unsupported HTTP method" in response.json()["detail"]
 
 
 # =============================================================================
@@ -264,28 +534,18 @@ class TestRuntimeRegistrationIntegration:
         initial_count = initial["total_tools"]
         
         # Register 3 tools
-        for i in range(3):
-            config = {
-                "name": f"lifecycle_tool_{i}",
-                "description": f"Lifecycle test tool {i}",
-                "endpoint_url": f"https://api.example.com/{i}",
-                "http_method": "GET",
-            }
-            response = client.post("/tools/register", json=config)
-            assert response.status_code == 200
+        response = client.post("/tools/register_batch", json=LIFECYCLE_TOOLS)
+        assert response.status_code == 200
         
         # Verify all registered
-        after_register = client.get("/tools/").json()
-        assert after_register["total_tools"] == initial_count + 3
+        assert response.json()["total_tools"] == initial_count + 3
         
         # Unregister all
-        for i in range(3):
-            response = client.delete(f"/tools/unregister/lifecycle_tool_{i}")
-            assert response.status_code == 200
+        response = client.post("/tools/unregister_batch", json=LIFECYCLE_TOOL_NAMES)
+        assert response.status_code == 200
         
         # Verify back to original count
-        after_unregister = client.get("/tools/").json()
-        assert after_unregister["total_tools"] == initial_count
+        assert response.json()["total_tools"] == initial_count
 
     def test_rest_api_endpoints_still_work(self, client):
         """Verify REST API endpoints still work alongside tool management."""
@@ -314,95 +574,50 @@ class TestRuntimeRegistrationIntegration:
 class TestPOSTMethodWithPayload:
     """Tests for POST method tools with request payloads."""
 
-    def test_register_post_tool_with_json_payload(self, client):
-        """Verify POST tool can be registered with JSON body support."""
-        config = {
+    @pytest.mark.parametrize("config", [
+        {
             "name": "create_post_tool",
             "description": "Create a new post with title and body",
             "endpoint_url": "https://jsonplaceholder.typicode.com/posts",
             "http_method": "POST",
             "tags": ["create", "post"],
-        }
-        
-        response = client.post("/tools/register", json=config)
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
-        assert data["tool"]["method"] == "POST"
-        assert data["tool"]["name"] == "create_post_tool"
-
-    def test_register_post_tool_with_complex_payload_schema(self, client):
-        """Verify POST tool registration for complex nested payload."""
-        config = {
+        },
+        {
             "name": "create_user_tool",
             "description": "Create a new user with nested address and company",
             "endpoint_url": "https://jsonplaceholder.typicode.com/users",
             "http_method": "POST",
             "tags": ["create", "user", "complex"],
-        }
-        
-        response = client.post("/tools/register", json=config)
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
-        assert "create_user_tool" in data["message"]
-
-    def test_register_put_tool_with_update_payload(self, client):
-        """Verify PUT tool can be registered for update operations."""
-        config = {
+        },
+        {
             "name": "update_post_tool",
             "description": "Update an existing post with new title and body",
             "endpoint_url": "https://jsonplaceholder.typicode.com/posts/1",
             "http_method": "PUT",
             "tags": ["update", "post"],
-        }
+        },
+    ], ids=["json_payload", "complex_payload", "update_payload"])
+    def test_register_tool_with_payload(self, config):
+        """Verify POST and PUT tools can be registered for JSON body payloads."""
+        # Registration logic only; the HTTP route is covered by the endpoint tests
+        data = add_external_tool(ExternalToolConfig(**config))
         
-        response = client.post("/tools/register", json=config)
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["tool"]["method"] == "PUT"
+        assert data["status"] == "success"
+        assert config["name"] in data["message"]
+        assert data["tool"]["name"] == config["name"]
+        assert data["tool"]["method"] == config["http_method"]
 
     def test_multiple_post_tools_with_different_payloads(self, client):
         """Verify multiple POST tools can be registered with different payload types."""
-        tools = [
-            {
-                "name": "create_comment",
-                "description": "Create a comment with postId, name, email, and body",
-                "endpoint_url": "https://jsonplaceholder.typicode.com/comments",
-                "http_method": "POST",
-                "tags": ["create", "comment"],
-            },
-            {
-                "name": "create_album",
-                "description": "Create an album with userId and title",
-                "endpoint_url": "https://jsonplaceholder.typicode.com/albums",
-                "http_method": "POST",
-                "tags": ["create", "album"],
-            },
-            {
-                "name": "create_todo",
-                "description": "Create a todo with userId, title, and completed status",
-                "endpoint_url": "https://jsonplaceholder.typicode.com/todos",
-                "http_method": "POST",
-                "tags": ["create", "todo"],
-            },
-        ]
-        
-        for tool_config in tools:
-            response = client.post("/tools/register", json=tool_config)
-            assert response.status_code == 200
-            assert response.json()["tool"]["method"] == "POST"
+        response = client.post("/tools/register_batch", json=POST_PAYLOAD_TOOLS)
+        assert response.status_code == 200
+        assert all(tool["method"] == "POST" for tool in response.json()["tools"])
         
         # Verify all tools are registered
-        tools_response = client.get("/tools/")
-        tools_data = tools_response.json()
-        
-        for tool_config in tools:
-            assert tool_config["name"] in tools_data["tools"]
-            assert tool_config["name"] in tools_data["external_tools"]
+        tools_data = client.get("/tools/").json()
+        names = {tool_config["name"] for tool_config in POST_PAYLOAD_TOOLS}
+        assert names <= set(tools_data["tools"])
+        assert names <= set(tools_data["external_tools"])
 
     def test_post_tool_lifecycle_with_payload(self, client):
         """Test complete lifecycle of POST tool: register → verify → unregister."""
@@ -420,10 +635,10 @@ class TestPOSTMethodWithPayload:
         
         register_response = client.post("/tools/register", json=config)
         assert register_response.status_code == 200
+        assert register_response.json()["total_tools"] == initial_count + 1
         
         # Verify registered
         tools = client.get("/tools/").json()
-        assert tools["total_tools"] == initial_count + 1
         assert "lifecycle_post_tool" in tools["external_tools"]
         
         # Unregister
@@ -431,9 +646,8 @@ class TestPOSTMethodWithPayload:
         assert unregister_response.status_code == 200
         
         # Verify removed
-        final_tools = client.get("/tools/").json()
-        assert final_tools["total_tools"] == initial_count
-        assert "lifecycle_post_tool" not in final_tools["external_tools"]
+        assert unregister_response.json()["total_tools"] == initial_count
+        assert "lifecycle_post_tool" not in client.get("/tools/").json()["external_tools"]
 
 
 # =============================================================================
@@ -445,75 +659,25 @@ class TestMixedHTTPMethodsIntegration:
 
     def test_register_crud_tools_for_resource(self, client):
         """Verify full CRUD set of tools can be registered for a resource."""
-        base_url = "https://jsonplaceholder.typicode.com/posts"
-        
-        crud_tools = [
-            {
-                "name": "posts_list",
-                "description": "List all posts",
-                "endpoint_url": base_url,
-                "http_method": "GET",
-                "tags": ["posts", "read"],
-            },
-            {
-                "name": "posts_create",
-                "description": "Create a new post with title, body, and userId",
-                "endpoint_url": base_url,
-                "http_method": "POST",
-                "tags": ["posts", "create"],
-            },
-            {
-                "name": "posts_update",
-                "description": "Update post with id=1 with new title and body",
-                "endpoint_url": f"{base_url}/1",
-                "http_method": "PUT",
-                "tags": ["posts", "update"],
-            },
-            {
-                "name": "posts_delete",
-                "description": "Delete post with id=1",
-                "endpoint_url": f"{base_url}/1",
-                "http_method": "DELETE",
-                "tags": ["posts", "delete"],
-            },
-        ]
-        
         # Register all CRUD tools
-        for tool_config in crud_tools:
-            response = client.post("/tools/register", json=tool_config)
-            assert response.status_code == 200
+        response = client.post("/tools/register_batch", json=CRUD_TOOLS)
+        assert response.status_code == 200
         
         # Verify all registered
         tools = client.get("/tools/").json()
-        for tool_config in crud_tools:
-            assert tool_config["name"] in tools["tools"]
-        
-        # Verify methods are correct
-        assert "posts_list" in tools["external_tools"]
-        assert "posts_create" in tools["external_tools"]
-        assert "posts_update" in tools["external_tools"]
-        assert "posts_delete" in tools["external_tools"]
+        names = {tool_config["name"] for tool_config in CRUD_TOOLS}
+        assert names <= set(tools["tools"])
+        assert names <= set(tools["external_tools"])
 
     def test_unregister_only_post_tools(self, client):
         """Verify only POST tools can be selectively unregistered."""
         # Register mix of GET and POST tools
-        tools = [
-            {"name": "get_data", "description": "Get data", "endpoint_url": "https://example.com/data", "http_method": "GET"},
-            {"name": "post_data", "description": "Post data", "endpoint_url": "https://example.com/data", "http_method": "POST"},
-            {"name": "get_users", "description": "Get users", "endpoint_url": "https://example.com/users", "http_method": "GET"},
-            {"name": "post_users", "description": "Post users", "endpoint_url": "https://example.com/users", "http_method": "POST"},
-        ]
-        
-        for tool in tools:
-            client.post("/tools/register", json=tool)
+        client.post("/tools/register_batch", json=MIXED_TOOLS)
         
         # Unregister only POST tools
-        client.delete("/tools/unregister/post_data")
-        client.delete("/tools/unregister/post_users")
+        client.post("/tools/unregister_batch", json=["post_data", "post_users"])
         
         # Verify GET tools still exist
-        remaining = client.get("/tools/").json()
-        assert "get_data" in remaining["external_tools"]
-        assert "get_users" in remaining["external_tools"]
-        assert "post_data" not in remaining["external_tools"]
-        assert "post_users" not in remaining["external_tools"]
+        remaining = set(client.get("/tools/").json()["external_tools"])
+        assert {"get_data", "get_users"} <= remaining
+        assert remaining.isdisjoint({"post_data", "post_users"})